@@ -1,50 +1,171 @@
 import json
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files, so worker processes never need a GUI backend
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
-import seaborn as sns
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
 import re
-from datetime import datetime
 import os
+from datetime import datetime
+import tempfile
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one go like small ones
+    ijson = None
+
+# Set global style (matplotlib's copy of seaborn's whitegrid style)
+plt.style.use('seaborn-v0_8-whitegrid')
+
+# Regular expressions used for word counting, compiled once
+NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')  # Anything other than numbers, alphabets, and spaces
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Files at least this large are stream-parsed to avoid holding the raw text and the parsed data in memory together
+STREAM_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+EPOCH = datetime(1970, 1, 1)
+
+# Columns produced by parse_json; a Parquet cache with different columns was written by an older version
+CACHE_COLUMNS = ['sender', 'timestamp_ms', 'content', 'reactions', 'reaction_count']
 
-# Set global style for seaborn
-sns.set_style("whitegrid")
+# Helper function to count the most common raw unicode escape sequences (for emojis and reactions)
+def most_common_raw_unicode(text, top_n):
+    codepoints = np.frombuffer(text.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+    values, counts = np.unique(codepoints[codepoints > 127], return_counts=True)
+    # Only the top entries are formatted as escape sequences
+    top = np.argsort(-counts, kind='stable')[:top_n]
+    return [(f'\\u{values[i]:04x}', int(counts[i])) for i in top]
 
-# Helper function to extract raw unicode escape sequences (for emojis)
-def extract_raw_unicode(text):
-    return [f'\\u{ord(c):04x}' for c in text if ord(c) > 127]
+# Helper function to convert millisecond timestamps to local time, like datetime.fromtimestamp
+def to_local_datetime(timestamps_ms):
+    timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+    # UTC offsets only change on quarter-hour boundaries, so look each offset up once per 15-minute block
+    blocks, inverse = np.unique(timestamps_ms // 900_000, return_inverse=True)
+    offsets = np.array([(datetime.fromtimestamp(block * 900) - EPOCH).total_seconds() - block * 900
+                        for block in blocks.tolist()], dtype=np.int64)
+    return pd.to_datetime(timestamps_ms + offsets[inverse] * 1000, unit='ms')
 
-# Clean the text by removing unwanted characters (keeping numbers and alphabets)
-def clean_text(text):
-    text = re.sub(r'[^a-zA-Z0-9\s]', '', text)  # Keep numbers, alphabets, and spaces
-    return text
+# Helper function to decode JSON text, preferring orjson when it is installed
+def load_json(raw_data):
+    if orjson:
+        try:
+            return orjson.loads(raw_data)
+        except orjson.JSONDecodeError:  # orjson is stricter (e.g. lone surrogate escapes); retry with the stdlib parser
+            pass
+    return json.loads(raw_data)
 
-# Load and parse the JSON data
+# Parse the JSON data into a DataFrame
+def parse_json(file_path):
+    senders, timestamps, contents, reactions = [], [], [], []
+
+    # Instagram escapes non-ASCII text inside the JSON itself, so the raw bytes can be parsed directly
+    with open(file_path, 'rb') as file:
+        if ijson and os.path.getsize(file_path) >= STREAM_PARSE_MIN_BYTES:
+            messages = ijson.items(file, 'messages.item')
+        else:
+            raw_data = file.read()
+            data = load_json(raw_data)
+            messages = data.get("messages", [])
+
+        # Collect each field into its own column in a single pass over the messages
+        for message in messages:
+            senders.append(message.get('sender_name', 'Unknown'))
+            timestamps.append(message.get('timestamp_ms', 0))
+            contents.append(message.get('content', ''))
+            reactions.append(message.get('reactions', []))
+
+    return pd.DataFrame({
+        'sender': pd.Categorical(senders),
+        'timestamp_ms': np.asarray(timestamps, dtype=np.int64),
+        'content': pd.Series(contents, dtype=object),  # Plain Python strings can hold any escaped text, including lone surrogates
+        'reactions': reactions,
+        'reaction_count': np.fromiter(map(len, reactions), dtype=np.int32, count=len(reactions))
+    })
+
+# Read a Parquet copy of the parsed data, returning None if it is unreadable or from an older layout
+def read_cache(cache_path):
+    try:
+        df = pd.read_parquet(cache_path)
+    except Exception:  # Missing engine, truncated or corrupt file; the JSON is parsed again instead
+        return None
+    if list(df.columns) != CACHE_COLUMNS:
+        return None
+    df['reactions'] = df['reactions'].map(list)  # Parquet hands list columns back as arrays
+    return df
+
+# Write a Parquet copy of the parsed data; failing to cache never stops the analysis
+def write_cache(df, cache_path):
+    # Write to a temporary file first so an interrupted write never leaves a truncated cache behind
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(cache_path) + '.',
+                                        dir=os.path.dirname(cache_path) or '.')
+    except OSError:  # Folder is not writable
+        return
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception:  # No Parquet engine, unsupported data, or a failed write
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+# Load the JSON data, reusing a Parquet copy stored next to it when it is up to date
 def load_data(file_path):
-    with open(file_path, 'r', encoding='latin-1') as file:
-        raw_data = file.read()
-        data = json.loads(raw_data)
-
-    messages = []
-    for message in data.get("messages", []):
-        messages.append({
-            'sender': message.get('sender_name', 'Unknown'),
-            'timestamp': datetime.fromtimestamp(message.get('timestamp_ms', 0) / 1000),
-            'content': message.get('content', ''),
-            'reactions': message.get('reactions', [])
-        })
-    return pd.DataFrame(messages)
-
-# Function to remove 'Meta AI' users
-def remove_meta_ai(df):
-    return df[df['sender'] != 'Meta AI']
-
-# Filter data by date
-def filter_by_date(df, start_date, end_date):
-    return df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
-
-# Function to save the plots to Downloads folder with the user's name
-def save_plot(filename, user=None):
+    cache_path = file_path + '.parquet'
+    df = None
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        df = read_cache(cache_path)
+    if df is None:
+        df = parse_json(file_path)
+        write_cache(df, cache_path)
+
+    # Timestamps are cached as raw milliseconds and converted to local time on every load,
+    # so a cache stays correct when it is read under a different time zone
+    df.insert(1, 'timestamp', to_local_datetime(df.pop('timestamp_ms')))
+    return df
+
+# Function to mark messages from 'Meta AI' users
+def is_meta_ai(df):
+    return df['sender'] == 'Meta AI'
+
+# Mark messages within the date range
+def in_date_range(df, start_date, end_date):
+    return (df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)
+
+# Select the messages to analyze
+def select_messages(df, start_date, end_date):
+    # Remove "Meta AI" user and filter by date in a single selection
+    df = df[~is_meta_ai(df) & in_date_range(df, start_date, end_date)]
+
+    # Message lengths shared by the summary and the message length analysis
+    return df.assign(msg_length=df['content'].fillna('').str.len().astype('int32'))
+
+# For interactive use, keep the last few loaded files and selections in memory; the modification time is
+# part of the key so edited files are reloaded (the cached frames are shared, so callers must not modify them)
+@lru_cache(maxsize=4)
+def load_data_cached(file_path, mtime):
+    return load_data(file_path)
+
+@lru_cache(maxsize=4)
+def select_messages_cached(file_path, mtime, start_date, end_date):
+    return select_messages(load_data_cached(file_path, mtime), start_date, end_date)
+
+# Function to save the plots to Downloads folder with the chat's and user's names
+def save_plot(ax, filename, user=None, chat=None):
     # Get the path to the user's Downloads folder
     download_path = os.path.join(os.path.expanduser('~'), 'Downloads')
     
@@ -52,179 +173,206 @@ def save_plot(filename, user=None):
     if user:
         filename = f"{user}_{filename}"
 
-    # Check if file already exists and append a number if necessary
+    # If a chat name is provided, add it to the filename so plots from different chats can be told apart
+    if chat:
+        filename = f"{chat}_{filename}"
+
+    # Claim the file name atomically so parallel workers never overwrite each other's plots;
+    # if it is already taken, append a suffix unique to this process and moment instead of probing for a free number
     file_path = os.path.join(download_path, filename)
-    base_name, ext = os.path.splitext(filename)
-    counter = 1
-    while os.path.exists(file_path):
-        filename = f"{base_name}_{counter}{ext}"
-        file_path = os.path.join(download_path, filename)
-        counter += 1
+    try:
+        fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
+        base_name, ext = os.path.splitext(filename)
+        file_path = os.path.join(download_path, f"{base_name}_{os.getpid()}_{time.monotonic_ns()}{ext}")
+        fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    os.close(fd)
     
-    # Save the figure to the Downloads folder
-    plt.savefig(file_path, bbox_inches='tight')
-    plt.close()
+    # Save the figure to the Downloads folder, removing the claimed file if saving fails
+    try:
+        ax.figure.savefig(file_path, bbox_inches='tight')
+    except Exception:
+        os.remove(file_path)
+        raise
 
 # Analysis functions
-def avg_messages_per_day(df, user=None):
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    date_range = pd.date_range(start=df['timestamp'].min(), end=df['timestamp'].max(), freq='D')
-    daily_msgs = df.groupby(df['timestamp'].dt.date).size()
-    daily_msgs = daily_msgs.reindex(date_range.date, fill_value=0)
+def avg_messages_per_day(df, ax, user=None, chat=None):
+    # Count messages by day offset from the first day; days without messages get a zero count
+    days = df['timestamp'].to_numpy().astype('datetime64[D]')
+    first_day = days.min()
+    daily_msgs = np.bincount((days - first_day).astype(np.int64))
+    date_range = first_day + np.arange(len(daily_msgs))
     
-    plt.figure(figsize=(14, 8))
-    plt.plot(daily_msgs.index, daily_msgs.values, marker='o', color='coral', linewidth=2)
-    plt.title('Messages per Day', fontsize=16)
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Messages per Day', fontsize=12)
-    plt.xticks(daily_msgs.index[::30], rotation=45)
+    ax.clear()
+    ax.plot(date_range, daily_msgs, color='coral', linewidth=2)
+    ax.set_title('Messages per Day', fontsize=16)
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Messages per Day', fontsize=12)
+    ax.xaxis.set_major_locator(mdates.MonthLocator())
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    ax.tick_params(axis='x', labelrotation=45)
     
-    save_plot('messages_per_day.png', user)
+    save_plot(ax, 'messages_per_day.png', user, chat)
 
-def messages_summary(df, user=None):
+def messages_summary(df, gb, user=None):
     total_messages = len(df)
-    total_reactions = sum(len(reactions) for reactions in df['reactions'])
-    total_message_length = df['content'].apply(len).sum()
-    user_summary = df.groupby('sender').agg(
+    total_reactions = df['reaction_count'].sum()
+    total_message_length = df['msg_length'].sum()
+    user_summary = gb.agg(
         total_messages=('content', 'size'),
-        total_reactions=('reactions', lambda x: sum(len(reaction) for reaction in x)),
-        total_message_length=('content', lambda x: sum(len(msg) for msg in x))
-    )
-    print("\n=== Total Counts (by User) ===")
-    print(user_summary)
-    print(f"\nTotal Messages: {total_messages}")
-    print(f"Total Reactions: {total_reactions}")
-    print(f"Total Message Length: {total_message_length} characters")
-
-def messages_per_user(df, user=None):
-    user_counts = df.groupby(['sender', df['timestamp'].dt.to_period('W')]).size().unstack(fill_value=0)
+        total_reactions=('reaction_count', 'sum'),
+        total_message_length=('msg_length', 'sum')
+    ).sort_index()  # The shared grouping is unsorted; list users alphabetically
+    return (f"\n=== Total Counts (by User) ===\n"
+            f"{user_summary}\n"
+            f"\nTotal Messages: {total_messages}\n"
+            f"Total Reactions: {total_reactions}\n"
+            f"Total Message Length: {total_message_length} characters")
+
+def messages_per_user(gb_week, ax, user=None, chat=None):
+    user_counts = gb_week.size().unstack(fill_value=0)
     user_counts = user_counts.T  # Transpose for line plot compatibility
-    user_counts.plot(kind='line', marker='o', figsize=(14, 8), linewidth=2)
-    plt.title('Messages per User (Week-over-Week)', fontsize=16)
-    plt.xlabel('Week', fontsize=12)
-    plt.ylabel('Number of Messages', fontsize=12)
-    plt.legend(title='User')
-    plt.xticks(rotation=45)
+    ax.clear()
+    user_counts.plot(kind='line', marker='o', ax=ax, linewidth=2)
+    ax.set_title('Messages per User (Week-over-Week)', fontsize=16)
+    ax.set_xlabel('Week', fontsize=12)
+    ax.set_ylabel('Number of Messages', fontsize=12)
+    ax.legend(title='User')
+    ax.tick_params(axis='x', labelrotation=45)
     
-    save_plot('messages_per_user.png', user)
+    save_plot(ax, 'messages_per_user.png', user, chat)
 
-def avg_message_length(df, user=None):
-    df['msg_length'] = df['content'].apply(lambda x: len(x) if isinstance(x, str) else 0)
-    
-    # Group by sender and day to calculate average message length per user per day
-    avg_length = df.groupby([df['sender'], df['timestamp'].dt.date])['msg_length'].mean().unstack(fill_value=0)
-    
-    # Create a complete date range from the first to the last message's date
-    full_date_range = pd.date_range(start=df['timestamp'].min().date(), end=df['timestamp'].max().date(), freq='D')
+def avg_message_length(df, ax, user=None, chat=None):
+    # Resample each sender's messages into daily bins to calculate average message length per user per day
+    avg_length = df.set_index('timestamp').groupby('sender', observed=True)['msg_length'].resample('D').mean().unstack('sender')
     
-    # Reindex the average length dataframe to include all days in the full date range
-    avg_length = avg_length.reindex(columns=full_date_range.date, fill_value=0)
+    # Fill in the days between senders' active periods, and count days without messages as zero
+    avg_length = avg_length.asfreq('D').fillna(0)
     
     # Plot each user's average message length on the same chart
-    plt.figure(figsize=(14, 8))
-    for user in avg_length.index:
-        plt.plot(avg_length.columns, avg_length.loc[user], marker='o', label=user, linewidth=2)
+    ax.clear()
+    for user in avg_length.columns:
+        ax.plot(avg_length.index, avg_length[user], label=user, linewidth=2)
 
-    plt.title('Average Message Length per User (Day-over-Day)', fontsize=16)
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Average Message Length', fontsize=12)
-    plt.xticks(rotation=45)
-    plt.legend(title='User')
+    ax.set_title('Average Message Length per User (Day-over-Day)', fontsize=16)
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Average Message Length', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend(title='User')
 
-    save_plot('average_message_length_per_user.png', user)
+    save_plot(ax, 'average_message_length_per_user.png', user, chat)
 
-def most_common_words_per_user(df, top_n=25, user=None):
+def most_common_words_per_user(df, gb, ax, top_n=25, user=None, chat=None):
+    # Tokenize every message in one vectorized pass, keeping only numbers, alphabets, and spaces
+    tokens = (df['content'].fillna('').str.lower()
+              .str.replace(NON_ALNUM_RE, '', regex=True)
+              .str.findall(WORD_RE)
+              .to_numpy())
+
+    # Count each user's token lists in one Counter call over the chained tokens
     user_words = {}
-    for user, group in df.groupby('sender'):
-        words = Counter()
-        for content in group['content'].dropna():
-            cleaned_text = clean_text(content.lower())
-            words.update(re.findall(r'\b\w+\b', cleaned_text))
-        user_words[user] = words.most_common(top_n)
+    for user, rows in gb.indices.items():
+        user_words[user] = Counter(chain.from_iterable(tokens[rows])).most_common(top_n)
 
     # Plotting the most common words per user
     for user, words in user_words.items():
         common_words = pd.DataFrame(words, columns=['Word', 'Frequency'])
-        sns.barplot(data=common_words, x='Frequency', y='Word', palette="muted")
-        plt.title(f'Top {top_n} Most Common Words for {user}', fontsize=16)
-        plt.xlabel('Frequency', fontsize=12)
-        plt.ylabel('Word', fontsize=12)
+        ax.clear()
+        ax.tick_params(axis='x', labelrotation=0)  # Undo the rotation left by the line plots
+        ax.barh(common_words['Word'], common_words['Frequency'], color=plt.get_cmap('tab10')(np.arange(len(common_words)) % 10))
+        ax.invert_yaxis()  # Most common at the top
+        ax.set_title(f'Top {top_n} Most Common Words for {user}', fontsize=16)
+        ax.set_xlabel('Frequency', fontsize=12)
+        ax.set_ylabel('Word', fontsize=12)
         
-        save_plot(f'{user}_common_words.png', user)
+        save_plot(ax, f'{user}_common_words.png', user, chat)
 
-def most_used_emojis_per_user(df, top_n=10, user=None):
+def most_used_emojis_per_user(gb, ax, top_n=10, user=None, chat=None):
     user_emojis = {}
-    for user, group in df.groupby('sender'):
-        emoji_counter = Counter()
-        for content in group['content'].dropna():
-            emojis = extract_raw_unicode(content)
-            emoji_counter.update(emojis)
-        user_emojis[user] = emoji_counter.most_common(top_n)
+    for user, contents in gb['content']:
+        user_emojis[user] = most_common_raw_unicode(''.join(contents.dropna()), top_n)
 
     # Plotting the most used emojis per user
     for user, emojis in user_emojis.items():
         common_emojis = pd.DataFrame(emojis, columns=['Emoji', 'Frequency'])
-        sns.barplot(data=common_emojis, x='Frequency', y='Emoji', palette="Blues_d")
-        plt.title(f'Most Used Emojis for {user}', fontsize=16)
-        plt.xlabel('Frequency', fontsize=12)
-        plt.ylabel('Emoji', fontsize=12)
+        ax.clear()
+        ax.tick_params(axis='x', labelrotation=0)  # Undo the rotation left by the line plots
+        ax.barh(common_emojis['Emoji'], common_emojis['Frequency'], color=plt.get_cmap('Blues_r')(np.linspace(0.1, 0.7, len(common_emojis))))
+        ax.invert_yaxis()  # Most used at the top
+        ax.set_title(f'Most Used Emojis for {user}', fontsize=16)
+        ax.set_xlabel('Frequency', fontsize=12)
+        ax.set_ylabel('Emoji', fontsize=12)
         
-        save_plot(f'{user}_most_used_emojis.png', user)
+        save_plot(ax, f'{user}_most_used_emojis.png', user, chat)
 
-def most_used_reactions_per_user(df, user=None):
+def most_used_reactions_per_user(gb, ax, user=None, chat=None):
     user_reactions = {}
-    for user, group in df.groupby('sender'):
-        reactions = Counter()
-        for reaction_list in group['reactions']:
-            if reaction_list:
-                for reaction in reaction_list:
-                    for char in reaction['reaction']:
-                        if ord(char) > 127:
-                            reactions.update([f'\\u{ord(char):04x}'])
-        user_reactions[user] = reactions.most_common(10)
+    for user, reaction_lists in gb['reactions']:
+        reactions = ''.join(reaction['reaction'] for reaction_list in reaction_lists for reaction in reaction_list)
+        user_reactions[user] = most_common_raw_unicode(reactions, 10)
 
     # Plotting the most used reactions per user
     for user, reactions in user_reactions.items():
         common_reactions = pd.DataFrame(reactions, columns=['Reaction', 'Frequency'])
-        sns.barplot(data=common_reactions, x='Frequency', y='Reaction', palette="viridis")
-        plt.title(f'Most Used Reactions for {user}', fontsize=16)
-        plt.xlabel('Frequency', fontsize=12)
-        plt.ylabel('Reaction', fontsize=12)
+        ax.clear()
+        ax.tick_params(axis='x', labelrotation=0)  # Undo the rotation left by the line plots
+        ax.barh(common_reactions['Reaction'], common_reactions['Frequency'], color=plt.get_cmap('viridis')(np.linspace(0, 1, len(common_reactions))))
+        ax.invert_yaxis()  # Most used at the top
+        ax.set_title(f'Most Used Reactions for {user}', fontsize=16)
+        ax.set_xlabel('Frequency', fontsize=12)
+        ax.set_ylabel('Reaction', fontsize=12)
         
-        save_plot(f'{user}_most_used_reactions.png', user)
+        save_plot(ax, f'{user}_most_used_reactions.png', user, chat)
 
 # Main function to execute the analysis
-def main(file_path, start_date, end_date):
-    df = load_data(file_path)
-    df = remove_meta_ai(df)  # Remove "Meta AI" user
-
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-
-    # Filter by date
+def main(file_path, start_date, end_date, cache=True, verbose=True):
     start_date = pd.to_datetime(start_date)
     end_date = pd.to_datetime(end_date)
-    df = filter_by_date(df, start_date, end_date)
+    if cache:
+        df = select_messages_cached(file_path, os.path.getmtime(file_path), start_date, end_date)
+    else:
+        df = select_messages(load_data(file_path), start_date, end_date)
+
+    # Name the plots after the chat's folder so plots from different chats can be told apart;
+    # long chats are split into message_1.json, message_2.json, ..., so later parts also get their file name
+    chat = os.path.basename(os.path.dirname(file_path))
+    part = os.path.splitext(os.path.basename(file_path))[0]
+    if part != 'message_1':
+        chat = f"{chat}_{part}"
+
+    # Group once by sender (and by sender and week) and share the groupings across the analyses
+    gb = df.groupby('sender', sort=False, observed=True)
+    # The weekly grouping stays sorted so the weeks come out in order for the line plot
+    gb_week = df.groupby(['sender', df['timestamp'].dt.to_period('W')], observed=True)
+
+    # One figure is reused for every plot; each analysis clears it before drawing
+    fig, ax = plt.subplots(figsize=(14, 8))
 
     # Weekly message count per user
-    messages_per_user(df)
+    messages_per_user(gb_week, ax, chat=chat)
 
     # Average message length
-    avg_message_length(df)
+    avg_message_length(df, ax, chat=chat)
 
     # Average messages per day (with explicit day counts)
-    avg_messages_per_day(df)
+    avg_messages_per_day(df, ax, chat=chat)
 
     # Most common words per user (top 25)
-    most_common_words_per_user(df, top_n=25)
+    most_common_words_per_user(df, gb, ax, top_n=25, chat=chat)
 
     # Most used emojis per user (as raw unicode escape sequences)
-    most_used_emojis_per_user(df)
+    most_used_emojis_per_user(gb, ax, chat=chat)
 
     # Most used reactions per user (as raw unicode escape sequences)
-    most_used_reactions_per_user(df)
+    most_used_reactions_per_user(gb, ax, chat=chat)
+
+    plt.close(fig)
 
-    # Show total counts
-    messages_summary(df)
+    # Show total counts; under the process pool they are returned instead so the driver can print them in order
+    summary = f"\n##### {file_path} #####\n" + messages_summary(df, gb)
+    if verbose:
+        print(summary)
+    return summary
 # Run the analysis
 file_paths = [r"C:\Users\jishn\Python\inbox\Data\113_8093012077417211\message_1.json",
               r"C:\Users\jishn\Python\inbox\Data\aaryatoney_17877965864958819\message_1.json",
@@ -242,5 +390,12 @@ file_paths = [r"C:\Users\jishn\Python\inbox\Data\113_8093012077417211\message_1.
               r"C:\Users\jishn\Python\inbox\Data\vedanshi_17846303412228160\message_1.json"]
 start_date = '2023-01-01'
 end_date = '2024-12-31'
-for filee in file_paths:
-    main(filee, start_date, end_date)
+
+# Each file is independent, so analyze them in parallel across processes;
+# executor.map yields the summaries in the order of file_paths.
+# Each worker sees a file only once, so the in-memory caches are skipped
+if __name__ == '__main__':
+    with ProcessPoolExecutor() as executor:
+        for summary in executor.map(partial(main, start_date=start_date, end_date=end_date, cache=False, verbose=False), file_paths):
+            print(summary)
+